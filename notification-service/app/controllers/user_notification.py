@@ -1,22 +1,22 @@
-from app.utils.schemas.user_schema import welcome_message, verification_message, update_user_message
+from app.utils.schemas.user_schema import WELCOME_BODY, VERIFICATION_BODY, UPDATE_USER_BODY
 from app.utils.boto_config import send_email_via_boto
 
 
 def welcome_notification_func(email: str):
     subject = "Welcome to E-commerce!"
-    response = send_email_via_boto(email, subject, welcome_message)
+    response = send_email_via_boto(email, subject, WELCOME_BODY)
     print(response)
 
 
 def verified_notification_func(email: str):
     subject = "Your Account has been Verified"
-    response = send_email_via_boto(email, subject, verification_message)
+    response = send_email_via_boto(email, subject, VERIFICATION_BODY)
     print(response)
 
 
 def user_update_notification_func(email: str):
     subject = "Your Account Details have been Updated"
-    response = send_email_via_boto(email, subject, update_user_message)
+    response = send_email_via_boto(email, subject, UPDATE_USER_BODY)
     print(response)
 
 
@@ -1,11 +1,17 @@
 from typing import Union, List
+import asyncio
 import json
 from aiokafka import AIOKafkaConsumer
 from aiokafka.errors import KafkaConnectionError
 from fastapi import HTTPException
-from app.settings import USER_TOPIC, ORDER_TOPIC, PAYMENT_TOPIC
+from app.settings import USER_TOPIC, ORDER_TOPIC, PAYMENT_TOPIC, SES_MAX_SEND_RATE
 from app.controllers import user_notification, order_notification, payment_notification
 
+MAX_BATCH_SIZE = 50
+BATCH_TIMEOUT_MS = 1000
+# Shared by all consumers so concurrent sends never exceed the SES account's send rate
+ses_send_slots = asyncio.Semaphore(SES_MAX_SEND_RATE)
+
 async def get_kafka_consumer(*topics: Union[str, List[str]]):
     consumer_kafka = AIOKafkaConsumer(
         *topics,
@@ -16,24 +22,42 @@ async def get_kafka_consumer(*topics: Union[str, List[str]]):
     await consumer_kafka.start()
     return consumer_kafka
 
+async def send_notification(value: dict, notification_func_map):
+    notification_type = value.get("notification_type")
+    email = value.get("email")
+
+    if notification_type and email:
+        notification_func = notification_func_map.get(notification_type)
+        if notification_func:
+            # boto3 calls are blocking, so each send runs in a worker thread
+            async with ses_send_slots:
+                await asyncio.to_thread(notification_func, email)
+        else:
+            print(f"Unknown notification type: {notification_type}")
+    else:
+        print("Invalid message format")
+
+async def flush(batch, notification_func_map):
+    sends = []
+    for message in batch:
+        try:
+            value = json.loads(bytes(message.value).decode("utf-8"))
+            sends.append(send_notification(value, notification_func_map))
+        except json.JSONDecodeError as e:
+            print(f"Failed to decode message: {e}")
+    # Send the batch concurrently, bounded by the SES send rate
+    results = await asyncio.gather(*sends, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"Failed to send notification: {result}")
+
 async def process_messages(consumer_kafka, notification_func_map):
     try:
-        async for message in consumer_kafka:
-            try:
-                value = json.loads(bytes(message.value).decode("utf-8"))
-                notification_type = value.get("notification_type")
-                email = value.get("email")
-                
-                if notification_type and email:
-                    notification_func = notification_func_map.get(notification_type)
-                    if notification_func:
-                        notification_func(email)
-                    else:
-                        print(f"Unknown notification type: {notification_type}")
-                else:
-                    print("Invalid message format")
-            except json.JSONDecodeError as e:
-                print(f"Failed to decode message: {e}")
+        while True:
+            batches = await consumer_kafka.getmany(timeout_ms=BATCH_TIMEOUT_MS, max_records=MAX_BATCH_SIZE)
+            batch = [message for messages in batches.values() for message in messages]
+            if batch:
+                await flush(batch, notification_func_map)
     except KafkaConnectionError as ke:
         raise HTTPException(status_code=500, detail=f"Kafka connection error: {str(ke)}")
     finally:
@@ -10,5 +10,7 @@ try:
     USER_TOPIC = Config().get("USER_TOPIC")
     ORDER_TOPIC = Config().get("ORDER_TOPIC")
     PAYMENT_TOPIC = Config().get("PAYMENT_TOPIC")
+    # Emails per second the SES account may send (1 in the sandbox)
+    SES_MAX_SEND_RATE = Config().get("SES_MAX_SEND_RATE", cast=int, default=1)
 except EnvironError as ee:
     raise HTTPException(status_code=400, detail=str(ee))
\ No newline at end of file
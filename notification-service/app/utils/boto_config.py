@@ -1,4 +1,5 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import HTTPException
 
@@ -9,6 +10,9 @@ client = boto3.client(
     region_name=AWS_REGION,
     aws_access_key_id=AWS_ACCESS_KEY,
     aws_secret_access_key=AWS_SECRET_KEY,
+    # Retry SES "Throttling" errors with backoff and client-side rate limiting
+    # instead of failing the send when the account's send rate is exceeded
+    config=Config(retries={"max_attempts": 10, "mode": "adaptive"}),
 )
 
 
@@ -1,4 +1,7 @@
-welcome_message = """
+import re
+from jinja2 import DictLoader, Environment
+
+_base_html = """
 <html>
 <head>
 </head>
@@ -19,10 +22,10 @@ welcome_message = """
                 <div style="width: 70%; display: flex; flex-direction: column; align-items: center; gap: 5px;">
                     <p
                         style="text-align: center; color: rgb(142, 169, 173); font-family: Cambria, Cochin, Georgia, Times, 'Times New Roman', serif; font-size: large; letter-spacing: 1px;">
-                        Welcome to E-commerce! We are excited to have you on board. Start exploring our wide range of products today.
+                        {% block message %}{% endblock %}
                     </p>
                     <button style="margin: 10px; padding: 10px; border-radius: 15%; background-color: rgb(0, 0, 0);"><a
-                            href="https://www.yourwebsite.com" style="text-decoration: none; color: white;">Go to Website</a></button>
+                            href="{% block cta_href %}{% endblock %}" style="text-decoration: none; color: white;">{% block cta_label %}{% endblock %}</a></button>
                 </div>
                 <div style="height: 0.4px; background-color: #8BA2AC; width: 80%; margin: 5px;"></div>
                 <footer>
@@ -39,84 +42,66 @@ welcome_message = """
 
 # ==============================================================================================================================
 
-verification_message = """
-<html>
-<head>
-</head>
-<body>
-    <main
-        style="height: 100%; padding: 2em; margin: 1em; background-color: rgb(243, 243, 243); display: flex; justify-content: center; align-items: center;">
-        <div style="width: 100%;">
-            <div style="height: 0.4px; width: 100%; margin-bottom: 10px; background-color: darkgray;">
-            </div>
-            <div style="display: flex; flex-direction: column; align-items: center; background: rgb(203,192,71); background: linear-gradient(to top, rgb(5, 35, 59)0%,rgb(30, 81, 122)60%,
-                rgb(161, 178, 182) 100%); ">
-                <header style="display: flex; justify-content: center;">
-                    <img src="" alt="" srcset="">
-                    <h2>
-                        E-commerce
-                    </h2>
-                </header>
-                <div style="width: 70%; display: flex; flex-direction: column; align-items: center; gap: 5px;">
-                    <p
-                        style="text-align: center; color: rgb(142, 169, 173); font-family: Cambria, Cochin, Georgia, Times, 'Times New Roman', serif; font-size: large; letter-spacing: 1px;">
-                        Please verify your email address to complete your registration. Click the link below to verify your email.
-                    </p>
-                    <button style="margin: 10px; padding: 10px; border-radius: 15%; background-color: rgb(0, 0, 0);"><a
-                            href="https://www.yourwebsite.com/verify" style="text-decoration: none; color: white;">Verify Email</a></button>
-                </div>
-                <div style="height: 0.4px; background-color: #8BA2AC; width: 80%; margin: 5px;"></div>
-                <footer>
-                    <p style="color: rgb(142, 169, 173);">
-                        © copyright 2024 - 2026
-                    </p>
-                </footer>
-            </div>
-        </div>
-    </main>
-</body>
-</html>
+_welcome_html = """
+{% extends "base.html" %}
+{% block message %}Welcome to E-commerce! We are excited to have you on board. Start exploring our wide range of products today.{% endblock %}
+{% block cta_href %}https://www.yourwebsite.com{% endblock %}
+{% block cta_label %}Go to Website{% endblock %}
 """
 
-# ==============================================================================================================================
+_verification_html = """
+{% extends "base.html" %}
+{% block message %}Please verify your email address to complete your registration. Click the link below to verify your email.{% endblock %}
+{% block cta_href %}https://www.yourwebsite.com/verify{% endblock %}
+{% block cta_label %}Verify Email{% endblock %}
+"""
 
-update_user_message = """
-<html>
-<head>
-</head>
-<body>
-    <main
-        style="height: 100%; padding: 2em; margin: 1em; background-color: rgb(243, 243, 243); display: flex; justify-content: center; align-items: center;">
-        <div style="width: 100%;">
-            <div style="height: 0.4px; width: 100%; margin-bottom: 10px; background-color: darkgray;">
-            </div>
-            <div style="display: flex; flex-direction: column; align-items: center; background: rgb(203,192,71); background: linear-gradient(to top, rgb(5, 35, 59)0%,rgb(30, 81, 122)60%,
-                rgb(161, 178, 182) 100%); ">
-                <header style="display: flex; justify-content: center;">
-                    <img src="" alt="" srcset="">
-                    <h2>
-                        E-commerce
-                    </h2>
-                </header>
-                <div style="width: 70%; display: flex; flex-direction: column; align-items: center; gap: 5px;">
-                    <p
-                        style="text-align: center; color: rgb(142, 169, 173); font-family: Cambria, Cochin, Georgia, Times, 'Times New Roman', serif; font-size: large; letter-spacing: 1px;">
-                        Your account details have been successfully updated. If you did not make this change, please contact our support team immediately.
-                    </p>
-                    <button style="margin: 10px; padding: 10px; border-radius: 15%; background-color: rgb(0, 0, 0);"><a
-                            href="https://www.yourwebsite.com/support" style="text-decoration: none; color: white;">Contact Support</a></button>
-                </div>
-                <div style="height: 0.4px; background-color: #8BA2AC; width: 80%; margin: 5px;"></div>
-                <footer>
-                    <p style="color: rgb(142, 169, 173);">
-                        © copyright 2024 - 2026
-                    </p>
-                </footer>
-            </div>
-        </div>
-    </main>
-</body>
-</html>
+_update_user_html = """
+{% extends "base.html" %}
+{% block message %}Your account details have been successfully updated. If you did not make this change, please contact our support team immediately.{% endblock %}
+{% block cta_href %}https://www.yourwebsite.com/support{% endblock %}
+{% block cta_label %}Contact Support{% endblock %}
 """
 
 # ==============================================================================================================================
+
+_BETWEEN_TAGS_WS = re.compile(r">\s+<")
+_RUN_OF_WS = re.compile(r"\s+")
+
+
+def _minify_html(html: str) -> str:
+    html = _BETWEEN_TAGS_WS.sub("><", html)
+    return _RUN_OF_WS.sub(" ", html).strip()
+
+
+template_env = Environment(
+    loader=DictLoader({
+        "base.html": _minify_html(_base_html),
+        "welcome": _minify_html(_welcome_html),
+        "verification": _minify_html(_verification_html),
+        "update_user": _minify_html(_update_user_html),
+    }),
+    auto_reload=False,
+    cache_size=-1,
+)
+
+WELCOME_TMPL = template_env.get_template("welcome")
+VERIFICATION_TMPL = template_env.get_template("verification")
+UPDATE_USER_TMPL = template_env.get_template("update_user")
+
+
+def render_welcome(**ctx) -> str:
+    return WELCOME_TMPL.render(ctx)
+
+
+def render_verification(**ctx) -> str:
+    return VERIFICATION_TMPL.render(ctx)
+
+
+def render_update_user(**ctx) -> str:
+    return UPDATE_USER_TMPL.render(ctx)
+
+
+WELCOME_BODY = render_welcome()
+VERIFICATION_BODY = render_verification()
+UPDATE_USER_BODY = render_update_user()
@@ -1,6 +1,8 @@
 from datetime import datetime, timezone
 from typing import List, Literal, Optional
-import uuid
+import secrets
+from sqlalchemy import Column, Computed, Index, LargeBinary, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -71,12 +73,29 @@ class Product(SQLModel, table=True):
 
     Attributes:
         product_id (Optional[int]): Primary key for Product.
+        search_vector (Optional[str]): Full-text tsvector of name and description, computed and stored by the database.
         category_id (int): Foreign key linking to Category.
         gender_id (int): Foreign key linking to Gender.
         product_items (List[ProductItem]): One-to-many relationship with ProductItem.
     """
+    __table_args__ = (
+        Index("ix_product_search", "search_vector", postgresql_using="gin"),
+    )
+
     product_id: Optional[int] = Field(
         default=None, primary_key=True)  # Primary key for Product
+    # Mirrors product-service: full-text document maintained by the database
+    search_vector: Optional[str] = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', product_name || ' ' || product_description)",
+                persisted=True,
+            ),
+        ),
+    )
     # category_id: int = Field(foreign_key="category.category_id")  # Foreign key linking to Category
     # gender_id: int = Field(foreign_key="gender.gender_id")  # Foreign key linking to Gender
     product_name: str  # Name of the product
@@ -133,41 +152,46 @@ class Stock(SQLModel, table=True):
         stock_id (Optional[int]): Primary key for Stock.
         product_size_id (Optional[int]): Foreign key linking to ProductSize.
         stock (int): Stock level.
+        stock_level (Optional[Literal["Low", "Medium", "High"]]): Stock category computed and stored by the database.
         product_size (Optional[ProductSize]): One-to-one relationship with ProductSize.
-
-    Properties:
-        stock_level (Literal["Low", "Medium", "High"]): Categorizes stock level as "Low", "Medium", or "High".
     """
+    __table_args__ = (Index("ix_stock_level", "stock_level"),)
+
     stock_id: Optional[int] = Field(
         default=None, primary_key=True)  # Primary key for Stock
     product_size_id: int = Field(foreign_key="productsize.product_size_id")
     stock: int = 0  # Stock level
+    # Mirrors the generated column defined by product-service
+    stock_level: Optional[Literal["Low", "Medium", "High"]] = Field(
+        default=None,
+        sa_column=Column(
+            String,
+            Computed(
+                "CASE WHEN stock > 100 THEN 'High' "
+                "WHEN stock > 50 THEN 'Medium' ELSE 'Low' END",
+                persisted=True,
+            ),
+        ),
+    )
     product_size: Optional[ProductSize] = Relationship(
         back_populates="stock")  # One-to-one relationship with ProductSize
 
-    @property
-    def stock_level(self) -> Literal["Low", "Medium", "High"]:
-        """
-        Categorizes the stock level based on the quantity.
-
-        Returns:
-            Literal["Low", "Medium", "High"]: Stock level category.
-        """
-        if self.stock > 100:
-            return "High"
-        elif self.stock > 50:
-            return "Medium"
-        else:
-            return "Low"
-
 
 class User(SQLModel, table=True):
-    user_id: Optional[int] = Field(int, primary_key=True)
+    __table_args__ = (
+        Index("ix_user_email_verified", "user_email", "is_verified"),
+    )
+
+    user_id: Optional[int] = Field(default=None, primary_key=True)
     user_name: str
-    user_email: str
+    user_email: str = Field(index=True, unique=True)
     user_password: str
     country: str
     address: str = Field(max_length=60)
-    phone_number: int
+    phone_number: str = Field(sa_type=String(16))
     is_verified: bool = Field(default=False)
-    kid: str = Field(default=lambda: uuid.uuid4().hex)
+    kid: bytes = Field(
+        default_factory=lambda: secrets.token_bytes(16),
+        sa_column=Column(LargeBinary(16), nullable=False,
+                         index=True, unique=True),
+    )
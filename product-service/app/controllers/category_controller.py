@@ -1,5 +1,6 @@
 from typing import Annotated
 from sqlmodel import select
+from sqlalchemy.orm import defer
 from fastapi import Depends, HTTPException
 from app.utils.auth_admin import admin_required
 from app.models.categories_model import Category, Gender, Size
@@ -49,7 +50,7 @@ def add_gender_func(
 
 def search_products_by_category_func(category_id: int, session: DB_SESSION):
     if category_id:
-        products = session.exec(select(Product).where(
+        products = session.exec(select(Product).options(defer(Product.search_vector)).where(
             Product.category_id == category_id)).all()
         if products:
             return products
@@ -61,7 +62,7 @@ def search_products_by_category_func(category_id: int, session: DB_SESSION):
 
 def search_products_by_gender_func(gender_id: int, session: DB_SESSION):
     if gender_id:
-        products = session.exec(select(Product).where(
+        products = session.exec(select(Product).options(defer(Product.search_vector)).where(
             Product.gender_id == gender_id)).all()
         if products:
             return products
@@ -1,12 +1,64 @@
+import threading
+import time
 from typing import Annotated, List
-from fastapi import Depends, HTTPException, File, UploadFile
+from fastapi import Depends, HTTPException, File, Query, UploadFile
 from sqlmodel import select
 from app.db.db_connector import DB_SESSION
 from app.controllers.category_controller import search_category_func
-from app.models.product_model import Product, ProductItem, ProductFormModel, Stock, ProductSize, ProductImage
+from app.models.product_model import Product, ProductItem, ProductFormModel, Stock, ProductSize, ProductImage, ProductPage, to_product_out
 from app.utils.auth_admin import admin_required
 from app.config.s3_configuration import upload_files_in_s3
-from sqlalchemy import or_
+from sqlalchemy import func, or_
+from sqlalchemy.orm import defer, selectinload
+
+# Batch-load the Product -> ProductItem -> ProductSize -> Stock tree with one
+# IN query per level instead of a lazy SELECT per related row. The tsvector
+# is only used for matching, so it is never loaded with the product.
+product_tree_options = (
+    defer(Product.search_vector),
+    selectinload(Product.product_items)
+    .selectinload(ProductItem.sizes)
+    .selectinload(ProductSize.stock),
+    selectinload(Product.product_items)
+    .selectinload(ProductItem.product_images),
+)
+
+# Recent search results (normalized input -> product ids), kept for a short TTL
+# and dropped whenever a product is created, updated or deleted.
+SEARCH_CACHE_TTL_SECONDS = 60
+SEARCH_CACHE_MAX_ENTRIES = 1024
+_search_cache: dict[str, tuple[float, list[int]]] = {}
+_search_cache_lock = threading.Lock()
+
+
+def _normalize_search_input(input: str) -> str:
+    return " ".join(input.split())
+
+
+def _get_cached_search(key: str) -> list[int] | None:
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached is None:
+            return None
+        expires_at, product_ids = cached
+        if expires_at < time.monotonic():
+            del _search_cache[key]
+            return None
+        return product_ids
+
+
+def _set_cached_search(key: str, product_ids: list[int]) -> None:
+    with _search_cache_lock:
+        if key not in _search_cache and len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry
+            del _search_cache[next(iter(_search_cache))]
+        _search_cache[key] = (
+            time.monotonic() + SEARCH_CACHE_TTL_SECONDS, product_ids)
+
+
+def invalidate_search_cache() -> None:
+    with _search_cache_lock:
+        _search_cache.clear()
 
 
 def create_product_func(
@@ -52,7 +104,6 @@ def create_product_func(
             for product_size in product_item.sizes:
                 # Create a Stock instance for the product item
                 stock_table = Stock(stock=product_size.stock)
-                print(f"Stock Level: {stock_table.stock_level}")
                 # Create a ProductSize instance
                 product_size_schema = ProductSize(
                     size_id=product_size.size, price=product_size.price, stock=stock_table
@@ -86,6 +137,7 @@ def create_product_func(
         session.add(product_table)
         session.commit()
         session.refresh(product_table)
+        invalidate_search_cache()
 
         return product_table
 
@@ -126,44 +178,81 @@ def add_images_in_productitem_func(
 
 
 def get_product_func(product_id: int, session: DB_SESSION):
-    product = session.exec(select(Product).where(
+    product = session.exec(select(Product).options(defer(Product.search_vector)).where(
         Product.product_id == product_id)).one_or_none()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
 
 
-def get_all_products_func(session: DB_SESSION):
-    products = session.exec(select(Product)).all()
-    return products
+def get_all_products_func(
+    session: DB_SESSION,
+    cursor: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 40,
+):
+    # Keyset pagination: seek past the last product id seen instead of
+    # fetching the whole catalog. One extra row tells whether a next page exists.
+    products = session.exec(
+        select(Product)
+        .options(*product_tree_options)
+        .where(Product.product_id > cursor)
+        .order_by(Product.product_id)
+        .limit(limit + 1)).all()
+    # Past the first page an empty result just means the catalog is exhausted
+    if not products and not cursor:
+        raise HTTPException(
+            status_code=404, detail="Try again, products has not fetched.")
+    has_next = len(products) > limit
+    products = products[:limit]
+    next_cursor = products[-1].product_id if has_next else None
+    return ProductPage(items=to_product_out(products), next=next_cursor)
 
 
 def get_limited_products_func(limit: int, session: DB_SESSION):
-    products = session.exec(select(Product).limit(limit)).all()
-    return products
-
-
-def search_products_func(input: str, session: DB_SESSION):
+    products = session.exec(
+        select(Product).options(*product_tree_options).limit(limit)).all()
+    return to_product_out(products)
+
+
+def search_products_func(name: str, session: DB_SESSION):
+    input = _normalize_search_input(name)
+    cached_ids = _get_cached_search(input)
+    if cached_ids is not None:
+        products = session.exec(
+            select(Product)
+            .options(*product_tree_options)
+            .where(Product.product_id.in_(cached_ids))
+            .order_by(Product.product_id)).all()
+        return to_product_out(products)
 
     categories = search_category_func(input, session)
+    # search_category_func returns a message string when nothing matches
+    if not isinstance(categories, list):
+        categories = []
     category_ids = [category.category_id for category in categories]
     if category_ids:
         category_conditions = [Product.category_id ==
                                category_id for category_id in category_ids]
 
         products_by_category = session.exec(
-            select(Product).where(or_(*category_conditions))).all()
+            select(Product).options(*product_tree_options).where(or_(*category_conditions))).all()
     else:
         products_by_category = []
 
-    products_by_input = session.exec(select(Product).where(
-        (input in Product.product_name) or (
-            input in Product.product_description)
+    # Matched through the GIN index on Product.search_vector
+    products_by_input = session.exec(select(Product).options(*product_tree_options).where(
+        Product.search_vector.op("@@")(func.plainto_tsquery("english", input))
     )).all()
 
-    all_products_set = set(products_by_input).union(products_by_category)
-    all_products = list(all_products_set)
-    return all_products
+    # Table models are not hashable, so de-duplicate the two result sets by id
+    products_by_id = {product.product_id: product for product in products_by_category}
+    products_by_id.update(
+        (product.product_id, product) for product in products_by_input)
+    # Same order as the cached path, so repeated searches keep a stable ETag
+    all_products = [products_by_id[product_id]
+                    for product_id in sorted(products_by_id)]
+    _set_cached_search(input, [product.product_id for product in all_products])
+    return to_product_out(all_products)
 
 
 def update_product_func(
@@ -184,6 +273,7 @@ def update_product_func(
     session.add(product)
     session.commit()
     session.refresh(product)
+    invalidate_search_cache()
     return product
 
 
@@ -202,4 +292,5 @@ def delete_product_func(
         raise HTTPException(status_code=404, detail="Product not found")
     session.delete(product)
     session.commit()
+    invalidate_search_cache()
     return product_id
@@ -1,4 +1,7 @@
 from typing import Optional, List, Literal
+from dataclasses import dataclass
+from sqlalchemy import Column, Computed, Index, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import SQLModel, Field, Relationship
 
 
@@ -93,12 +96,29 @@ class Product(ProductBase, table=True):
 
     Attributes:
         product_id (Optional[int]): Primary key for Product.
+        search_vector (Optional[str]): Full-text tsvector of name and description, computed and stored by the database.
         category_id (int): Foreign key linking to Category.
         gender_id (int): Foreign key linking to Gender.
         product_items (List[ProductItem]): One-to-many relationship with ProductItem.
     """
+    __table_args__ = (
+        Index("ix_product_search", "search_vector", postgresql_using="gin"),
+    )
+
     product_id: Optional[int] = Field(
         default=None, primary_key=True)  # Primary key for Product
+    # Full-text document over name and description, maintained by the database
+    search_vector: Optional[str] = Field(
+        default=None,
+        exclude=True,
+        sa_column=Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', product_name || ' ' || product_description)",
+                persisted=True,
+            ),
+        ),
+    )
     # category_id: int = Field(foreign_key="category.category_id")  # Foreign key linking to Category
     # gender_id: int = Field(foreign_key="gender.gender_id")  # Foreign key linking to Gender
     product_items: List["ProductItem"] = Relationship(
@@ -149,102 +169,131 @@ class Stock(SQLModel, table=True):
         stock_id (Optional[int]): Primary key for Stock.
         product_size_id (Optional[int]): Foreign key linking to ProductSize.
         stock (int): Stock level.
+        stock_level (Optional[Literal["Low", "Medium", "High"]]): Stock category computed and stored by the database.
         product_size (Optional[ProductSize]): One-to-one relationship with ProductSize.
-
-    Properties:
-        stock_level (Literal["Low", "Medium", "High"]): Categorizes stock level as "Low", "Medium", or "High".
     """
+    __table_args__ = (Index("ix_stock_level", "stock_level"),)
+
     stock_id: Optional[int] = Field(
         default=None, primary_key=True)  # Primary key for Stock
     # Foreign key linking to ProductSize
     product_size_id: int = Field(foreign_key="productsize.product_size_id")
     stock: int = 0  # Stock level
+    # Categorized on write by the database, so reads need no Python branching
+    stock_level: Optional[Literal["Low", "Medium", "High"]] = Field(
+        default=None,
+        sa_column=Column(
+            String,
+            Computed(
+                "CASE WHEN stock > 100 THEN 'High' "
+                "WHEN stock > 50 THEN 'Medium' ELSE 'Low' END",
+                persisted=True,
+            ),
+        ),
+    )
     product_size: Optional[ProductSize] = Relationship(
         back_populates="stock")  # One-to-one relationship with ProductSize
 
-    @property
-    def stock_level(self) -> Literal["Low", "Medium", "High"]:
-        """
-        Categorizes the stock level based on the quantity.
-
-        Returns:
-            Literal["Low", "Medium", "High"]: Stock level category.
-        """
-        if self.stock > 100:
-            return "High"
-        elif self.stock > 50:
-            return "Medium"
-        else:
-            return "Low"
-
-
-# Sample JSON payload for creating a product
-sample_payload = {
-    "product_name": "Shirt",
-    "product_description": "New Shirt",
-    "product_items": [
-        {
-            "color": "green",
-            "image_url": "http://www.shirt.com",
-            "sizes": [
-                {
-                    "size": "small",
-                    "price": 200,
-                    "stock": 50
-                },
-                {
-                    "size": "medium",
-                    "price": 250,
-                    "stock": 10
-                },
-                {
-                    "size": "large",
-                    "price": 300,
-                    "stock": 0
-                }
-            ]
-        },
-        {
-            "color": "brown",
-            "image_url": "http://www.shirt.com",
-            "sizes": [
-                {
-                    "size": "extra small",
-                    "price": 100,
-                    "stock": 70
-                },
-                {
-                    "size": "medium",
-                    "price": 250,
-                    "stock": 10
-                },
-                {
-                    "size": "large",
-                    "price": 300,
-                    "stock": 0
-                }
-            ]
-        },
-        {
-            "color": "black",
-            "image_url": "http://www.shirt.com",
-            "sizes": [
-                {
-                    "size": "small",
-                    "price": 200,
-                    "stock": 50
-                },
-                {
-                    "size": "medium",
-                    "price": 250,
-                    "stock": 10
-                },
-                {
-                    "size": "large",
-                    "price": 300,
-                    "stock": 0
-                }
-            ]
-        }
-    ]
-}
+
+# Slotted read-only views of the product tree, used only for response serialization
+@dataclass(slots=True)
+class StockOut:
+    stock_id: int
+    stock: int
+    stock_level: Optional[Literal["Low", "Medium", "High"]]
+
+    @classmethod
+    def from_orm(cls, stock: Stock) -> "StockOut":
+        return cls(stock.stock_id, stock.stock, stock.stock_level)
+
+
+@dataclass(slots=True)
+class ProductSizeOut:
+    product_size_id: int
+    size_id: int
+    price: int
+    stock: Optional[StockOut]
+
+    @classmethod
+    def from_orm(cls, size: ProductSize) -> "ProductSizeOut":
+        stock = StockOut.from_orm(size.stock) if size.stock else None
+        return cls(size.product_size_id, size.size_id, size.price, stock)
+
+
+@dataclass(slots=True)
+class ProductImageOut:
+    product_image_id: int
+    product_image_url: str
+
+    @classmethod
+    def from_orm(cls, image: ProductImage) -> "ProductImageOut":
+        return cls(image.product_image_id, image.product_image_url)
+
+
+@dataclass(slots=True)
+class ProductItemOut:
+    item_id: int
+    color: str
+    sizes: List[ProductSizeOut]
+    product_images: List[ProductImageOut]
+
+    @classmethod
+    def from_orm(cls, item: ProductItem) -> "ProductItemOut":
+        return cls(
+            item.item_id,
+            item.color,
+            [ProductSizeOut.from_orm(size) for size in item.sizes],
+            [ProductImageOut.from_orm(image) for image in item.product_images],
+        )
+
+
+@dataclass(slots=True)
+class ProductOut:
+    product_id: int
+    product_name: str
+    product_description: str
+    product_type: str
+    duration: str
+    advance_payment_percentage: float
+    gender_id: int
+    category_id: int
+    product_items: List[ProductItemOut]
+
+    @classmethod
+    def from_orm(cls, product: Product) -> "ProductOut":
+        return cls(
+            product.product_id,
+            product.product_name,
+            product.product_description,
+            product.product_type,
+            product.duration,
+            product.advance_payment_percentage,
+            product.gender_id,
+            product.category_id,
+            [ProductItemOut.from_orm(item) for item in product.product_items],
+        )
+
+
+def to_product_out(products: List[Product]) -> List[ProductOut]:
+    """
+    Converts eager-loaded Product rows into slotted ProductOut views.
+
+    Args:
+        products (List[Product]): Products with their items, sizes, stock and images loaded.
+
+    Returns:
+        List[ProductOut]: Response views of the products.
+    """
+    return [ProductOut.from_orm(product) for product in products]
+
+
+class ProductPage(SQLModel):
+    """
+    A page of products returned by keyset pagination.
+
+    Attributes:
+        items (List[ProductOut]): Products in this page, ordered by product_id.
+        next (Optional[int]): Cursor for the next page, or None on the last page.
+    """
+    items: List[ProductOut]
+    next: Optional[int] = None
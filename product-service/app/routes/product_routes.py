@@ -1,10 +1,42 @@
+import hashlib
 from typing import Annotated
-from fastapi import APIRouter, HTTPException, Depends
-from app.models.product_model import Product
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from app.models.product_model import Product, ProductPage, ProductOut
 from app.controllers.product_controller import (create_product_func, get_product_func, update_product_func,
                                                 delete_product_func, get_all_products_func, search_products_func, get_limited_products_func, add_images_in_productitem_func)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Serializers built once at import and reused by the read routes below; returning a
+# ready Response skips FastAPI's per-request response_model validation pass.
+_PRODUCT_ADAPTER = TypeAdapter(Product)
+_PRODUCT_PAGE_ADAPTER = TypeAdapter(ProductPage)
+_PRODUCT_LIST_ADAPTER = TypeAdapter(list[ProductOut])
+
+
+# Anonymous catalog reads may be served from shared caches for a short while
+CATALOG_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def _json_response(adapter: TypeAdapter, content) -> Response:
+    return Response(content=adapter.dump_json(content), media_type="application/json")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _cached_json_response(request: Request, adapter: TypeAdapter, content) -> Response:
+    body = adapter.dump_json(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/create-product/", response_model=Product)
@@ -24,26 +56,23 @@ def add_images_in_product(message: Annotated[str, Depends(add_images_in_producti
 
 
 @router.get("/get_product/{product_id}", response_model=Product)
-def get_product(product: Annotated[Product, Depends(get_product_func)]):
+def get_product(request: Request, product: Annotated[Product, Depends(get_product_func)]):
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return _cached_json_response(request, _PRODUCT_ADAPTER, product)
 
 
-@router.get("/get_all_products/", response_model=list[Product])
-def get_all_products(products: Annotated[list[Product], Depends(get_all_products_func)]):
-    if not products:
-        raise HTTPException(
-            status_code=404, detail="Try again, products has not fetched.")
-    return products
+@router.get("/get_all_products/", response_model=ProductPage)
+def get_all_products(request: Request, products: Annotated[ProductPage, Depends(get_all_products_func)]):
+    return _cached_json_response(request, _PRODUCT_PAGE_ADAPTER, products)
 
 
-@router.get("/get_limited_products/", response_model=list[Product])
-def get_limited_products(products: Annotated[list[Product], Depends(get_limited_products_func)]):
+@router.get("/get_limited_products/", response_model=list[ProductOut])
+def get_limited_products(products: Annotated[list[ProductOut], Depends(get_limited_products_func)]):
     if not products:
         raise HTTPException(
             status_code=404, detail="Try again, products has not fetched.")
-    return products
+    return _json_response(_PRODUCT_LIST_ADAPTER, products)
 
 
 @router.put("/update_product/{product_id}", response_model=Product)
@@ -54,12 +83,12 @@ def update_product(product: Annotated[Product, Depends(update_product_func)]):
     return product
 
 
-@router.get("/search_products/{name}", response_model=list[Product])
-def search_products(products: Annotated[list[Product], Depends(search_products_func)]):
+@router.get("/search_products/{name}", response_model=list[ProductOut])
+def search_products(request: Request, products: Annotated[list[ProductOut], Depends(search_products_func)]):
     if not products:
         raise HTTPException(
             status_code=404, detail="Try again, products has not fetched.")
-    return products
+    return _cached_json_response(request, _PRODUCT_LIST_ADAPTER, products)
 
 
 @router.delete("/delete_product/{product_id}", response_model=str)
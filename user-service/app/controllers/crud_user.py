@@ -1,5 +1,5 @@
 import json
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 from app.models.user_models import User, UserModel, UserUpdateModel, UserAuth
 from app.db.db_connector import DB_SESSION
 from fastapi import HTTPException
@@ -42,7 +42,7 @@ async def create_user_func(user_form: UserModel, session: DB_SESSION, producer:
             raise HTTPException(
                 status_code=404, detail="This password already exist!")
     user = await add_user_in_db_func(user_form, session)
-    kong_func(user.user_name, user.kid, secret_key=None)
+    kong_func(user.user_name, user.kid_hex, secret_key=None)
     user_details = {
         "user_email": user_email,
         "user_password": user_password
@@ -88,13 +88,15 @@ def get_user_by_id_func(user_id: int, session: DB_SESSION):
 def update_user_func(user_id: int, user_details: UserUpdateModel, session: DB_SESSION):
     user = session.get(User, user_id)
     if not user:
-        HTTPException(status_code=400, detail="User not found")
-    updated_user = user_details.model_dump(exclude_unset=True)
-    for key, value in updated_user.items():
-        setattr(user, key, value)
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+        raise HTTPException(status_code=404, detail="User not found")
+    # Only the fields sent by the client are written, in a single UPDATE; explicit
+    # nulls are dropped since every user column is NOT NULL
+    updated_user = user_details.model_dump(exclude_unset=True, exclude_none=True)
+    if updated_user:
+        session.exec(update(User).where(
+            User.user_id == user_id).values(**updated_user))
+        session.commit()
+        session.refresh(user)
     return user
 
 
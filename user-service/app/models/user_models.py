@@ -1,15 +1,23 @@
-from typing import Optional
-import uuid
+from typing import Annotated, Optional
+import secrets
+from pydantic import StringConstraints, field_serializer
+from sqlalchemy import Column, Index, LargeBinary, String
 from sqlmodel import SQLModel, Field
 
 # ============================================================================================================================
 
 
+# Optional leading "+" followed by 7 to 15 digits (E.164 length)
+PHONE_NUMBER_PATTERN = r"^\+?\d{7,15}$"
+PhoneNumber = Annotated[str, StringConstraints(
+    max_length=16, pattern=PHONE_NUMBER_PATTERN)]
+
+
 class UserBase(SQLModel):
     user_name: str
     country: str
     address: str = Field(max_length=60)
-    phone_number: int
+    phone_number: PhoneNumber
 
 # ============================================================================================================================
 
@@ -28,16 +36,35 @@ class UserModel(UserAuth, UserBase):
 
 
 class User(UserModel, table=True):
-    user_id: Optional[int] = Field(primary_key=True)
+    __table_args__ = (
+        Index("ix_user_email_verified", "user_email", "is_verified"),
+    )
+
+    user_id: Optional[int] = Field(default=None, primary_key=True)
+    user_email: str = Field(index=True, unique=True)
+    phone_number: str = Field(sa_type=String(16))
     is_verified: bool = Field(default=False)
-    kid: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    # Raw 16 random bytes; half the size of the hex text in the row and index
+    kid: bytes = Field(
+        default_factory=lambda: secrets.token_bytes(16),
+        sa_column=Column(LargeBinary(16), nullable=False,
+                         index=True, unique=True),
+    )
+
+    @property
+    def kid_hex(self) -> str:
+        return self.kid.hex()
+
+    @field_serializer("kid")
+    def serialize_kid(self, kid: bytes) -> str:
+        return kid.hex()
 
 
 class UserUpdateModel(SQLModel):
-    user_name: str | None
-    user_email: str | None
-    address: str | None = Field(max_length=60)
-    phone_number: int | None
+    user_name: str | None = None
+    user_email: str | None = None
+    address: str | None = Field(default=None, max_length=60)
+    phone_number: PhoneNumber | None = None
 
 
 class SearchHistory():
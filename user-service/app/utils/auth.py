@@ -28,8 +28,8 @@ def generateToken(user: User, expires_delta: timedelta) -> str:
         "exp": expire
     }
     headers = {
-        "iss": user.kid,
-        "kid": user.kid
+        "iss": user.kid_hex,
+        "kid": user.kid_hex
     }
 
     # Encode token with user data and secret key